@@ -1,40 +1,101 @@
+import math
 import pygame
 from EasyPygame.input_controller import KeyboardController
+from EasyPygame.collision import SpatialGrid
 
-class Character(object):
-    
-    def __init__(self, spawn_coordinates=(0,0), size=20, sprite=None):
+# Loaded and scaled sprites keyed by (path, size), and blank squares keyed by (None, size, color).
+# Shared between every Character using them, so don't draw onto a Character's image.
+_SPRITE_CACHE = {}
+
+class Character(pygame.sprite.Sprite):
+    """
+    Characters are pygame sprites, so they can be put in a pygame.sprite.Group and drawn or updated all at once:
+    group.draw(canvas.surface), group.update(canvas)
+    """
+    def __init__(self, spawn_coordinates=(0,0), size=20, sprite=None, color=(128,70,128)):
+        super().__init__()
         self.size = size
+        self.color = color
         self.check_for_sprite(sprite)
         self.box_collider = self.image.get_rect()
         self.spawn_coordinates = spawn_coordinates
         self.box_collider.x, self.box_collider.y = spawn_coordinates[0], spawn_coordinates[1]
+        # exact position, box_collider only holds whole pixels
+        self._fx, self._fy = float(spawn_coordinates[0]), float(spawn_coordinates[1])
+
+    @property
+    def rect(self):
+        """ Same Rect as box_collider, under the name pygame.sprite.Group expects """
+        return self.box_collider
+
+    @rect.setter
+    def rect(self, value):
+        self.box_collider = value
 
     def check_for_sprite(self, sprite):
-        if sprite is None:
-            self.image = pygame.Surface((self.size,self.size))
-            self.image.fill((128,70,128))
-        else:
-            self.image = pygame.image.load(sprite)
-            self.image= pygame.transform.scale(self.image, (self.size, self.size))
+        key = (sprite, self.size) if sprite is not None else (None, self.size, tuple(pygame.Color(self.color)))
+        image = _SPRITE_CACHE.get(key)
+        if image is None:
+            if sprite is None:
+                image = pygame.Surface((self.size,self.size))
+                image.fill(self.color)
+            else:
+                image = pygame.image.load(sprite)
+                image = pygame.transform.scale(image, (self.size, self.size))
+            # Only cache once the image matches the display format, so blits skip per-pixel conversion.
+            # Characters made before the display exists get their own unconverted copy.
+            if pygame.display.get_surface() is not None:
+                image = image.convert() if sprite is None else image.convert_alpha()
+                _SPRITE_CACHE[key] = image
+        self.image = image
        
+    def move(self, dx, dy):
+        """ Moves by dx, dy. Fractional speeds add up over frames instead of being truncated every move """
+        box_collider = self.box_collider
+        # pick up any changes made straight to box_collider since the last move
+        if box_collider.x != math.floor(self._fx):
+            self._fx = float(box_collider.x)
+        if box_collider.y != math.floor(self._fy):
+            self._fy = float(box_collider.y)
+        self._fx += dx
+        self._fy += dy
+        box_collider.x, box_collider.y = math.floor(self._fx), math.floor(self._fy)
+
+    def update(self, canvas, keys=None):
+        """ Called once per frame, override to give a character its own behaviour """
+        pass
+
     def draw(self, surface):
         """ Draw on surface """
         # blit yourself at your current position
         surface.blit(self.image, (self.box_collider.x, self.box_collider.y))
 
     def check_collision(self, other_sprites):
+        """ other_sprites can be a list of characters or a SpatialGrid holding them """
+        if isinstance(other_sprites, SpatialGrid):
+            other_sprites = [sprite for sprite in other_sprites.query(self.box_collider) if sprite is not self]
+        box_collider = self.box_collider
         for enemy_sprite in other_sprites:
-            if self.box_collider.colliderect(enemy_sprite.box_collider):
+            if box_collider.colliderect(enemy_sprite.box_collider):
                 return True
 
+    def check_collision_single(self, other_sprite):
+        """ Checks against one sprite without wrapping it in a list """
+        return self.box_collider.colliderect(other_sprite.box_collider)
+
+    def check_collision_batch(self, other_sprites):
+        """ Returns the indices of every sprite in other_sprites that overlaps this one """
+        return self.box_collider.collidelistall([sprite.box_collider for sprite in other_sprites])
+
 
 class Player(Character):
 
-    def __init__(self, spawn_coordinates=(0,0), size=20, sprite=None):
-        super().__init__(spawn_coordinates, size, sprite)
+    def __init__(self, spawn_coordinates=(0,0), size=20, sprite=None, color=(128,70,128)):
+        super().__init__(spawn_coordinates, size, sprite, color)
         self.controller = KeyboardController(movement_speed=10)
 
+    def handle_keys(self,canvas, keys=None):
+        return self.controller.handle_keys(self, canvas, keys)
 
-    def handle_keys(self,canvas):
-        return self.controller.handle_keys(self, canvas)
+    def update(self, canvas, keys=None):
+        self.handle_keys(canvas, keys)
@@ -0,0 +1,58 @@
+DEFAULT_CELL_SIZE = 64
+
+
+class SpatialGrid:
+    """
+    Buckets objects into square cells so collision checks only look at nearby objects.
+
+    cell_size Type: int
+    Example: 50 (roughly the size of your biggest sprite). Left as None it is picked from the objects on rebuild, or 64 if there are none.
+    """
+    def __init__(self, cell_size=None):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def rebuild(self, objects):
+        """Clears the grid and inserts every object. Call once per frame after things have moved."""
+        self.cells = {}
+        objects = list(objects)
+        if self.cell_size is None and objects:
+            self.cell_size = max(max(obj.box_collider.size) for obj in objects)
+        for obj in objects:
+            self.insert(obj)
+
+    def insert(self, obj):
+        cell = self.cell_size or DEFAULT_CELL_SIZE
+        cells = self.cells
+        rect = obj.box_collider
+        for cx in range(rect.left // cell, rect.right // cell + 1):
+            for cy in range(rect.top // cell, rect.bottom // cell + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [obj]
+                else:
+                    bucket.append(obj)
+
+    def query(self, rect):
+        """Returns the objects sharing a cell with rect. These still need a precise rectangle test."""
+        cells = self.cells
+        if not cells:
+            return []
+        cell = self.cell_size or DEFAULT_CELL_SIZE
+        found = {}
+        for cx in range(rect.left // cell, rect.right // cell + 1):
+            for cy in range(rect.top // cell, rect.bottom // cell + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    for obj in bucket:
+                        found[id(obj)] = obj
+        return list(found.values())
+
+
+def batch_overlap(rects_a, rects_b):
+    """
+    Tests every rect in rects_a against every rect in rects_b.
+    Returns one list per rect in rects_a holding the indices of the rects in rects_b it overlaps.
+    """
+    rects_b = list(rects_b)
+    return [rect.collidelistall(rects_b) for rect in rects_a]
@@ -1,11 +1,13 @@
 import sys
 import pygame
 
+QUIT, KEYDOWN, KEYUP = pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP
 
 class Canvas:
 
     def __init__(self, screen_size = (600,600), background_color = (255,255,255)):
         self.screen_size = screen_size
+        self.width, self.height = screen_size
         self.background_color = background_color
         self.surface = pygame.display.set_mode(self.screen_size)
         self.surface.fill(self.background_color)
@@ -23,9 +25,14 @@ class Canvas:
         """
         self.background_color = background_color
         self.screen_size = screen_size
+        self.width, self.height = screen_size
         self.surface = pygame.display.set_mode(screen_size)
         self.surface.fill(background_color)
 
+    def clear(self):
+        """Paints the background color over the whole canvas."""
+        self.surface.fill(self.background_color)
+
 
 
 class Engine:
@@ -38,24 +45,57 @@ class Engine:
         self.clock = pygame.time.Clock() # The clock will be used to control how fast the screen updates
         self.fps = fps
         self.canvas = canvas
+        self.keys_held = {} # 1 for every key currently held down, filled in from the event queue
         pygame.display.set_caption(self.game_title)
 
     def await_closure(self):
-        """Checks if user input any commands to close the window."""
+        """Checks if user input any commands to close the window, and tracks which keys are held down."""
+        keys_held = self.keys_held
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            event_type = event.type
+            if event_type == KEYDOWN:
+                keys_held[event.key] = 1
+            elif event_type == KEYUP:
+                keys_held[event.key] = 0
+            elif event_type == QUIT:
                 pygame.quit()
                 sys.exit()
                 running = False
                 break
 
-    def game_loop(self, func):
+    def is_down(self, key):
+        """Returns True while key (e.g. pygame.K_w) is held down."""
+        return self.keys_held.get(key, 0) == 1
+
+    def draw_all(self, objects):
         """
-        Handles the game on runtime. Must come before your gameplay code. Whatever comes below this will happen inside your created game window.
+        Draws every object onto the canvas in a single batched blit call. Objects need an image and a box_collider.
+        """
+        sequence = [(obj.image, obj.box_collider) for obj in objects]
+        surface = self.canvas.surface
+        if hasattr(surface, "fblits"):
+            surface.fblits(sequence)
+        else:
+            surface.blits(sequence, doreturn=False)
+
+    def run(self, func, max_frames=None):
         """
-        while True:
+        Calls func once per frame. Runs until the window is closed, or for max_frames frames when given.
+        """
+        frame = 0
+        while max_frames is None or frame < max_frames:
+            # Wait for the frame first so events and key states read by func() are as fresh as possible.
+            self.clock.tick(self.fps)
             self.await_closure()
             func()
-            pygame.display.update()
-            self.canvas.surface.fill(self.canvas.background_color)
-            self.clock.tick(self.fps)
\ No newline at end of file
+            # The whole canvas is redrawn every frame, so flip it in one go. Passing a list of rects to
+            # pygame.display.update only pays off when a handful of small regions change.
+            pygame.display.flip()
+            self.canvas.clear()
+            frame += 1
+
+    def game_loop(self, func):
+        """
+        Handles the game on runtime. Must come before your gameplay code. Whatever comes below this will happen inside your created game window.
+        """
+        self.run(func)
\ No newline at end of file
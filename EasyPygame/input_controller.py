@@ -1,18 +1,26 @@
 import pygame
 
+# Key constants bound once so the per-frame lookups skip the pygame attribute access.
+_K_W, _K_A, _K_S, _K_D = pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d
+
 class KeyboardController:
-    
+
     def __init__(self,movement_speed=2):
         self.movement_speed = movement_speed
-    
-    def handle_keys(self, player, canvas):
-      """ Handles Keys """
-      key = pygame.key.get_pressed()
-      if key[pygame.K_s] and player.box_collider.y < canvas.screen_size[1]-player.size: # down key
-            player.box_collider.y += self.movement_speed # move down
-      if key[pygame.K_w] and player.box_collider.y > 0: # up ke
-            player.box_collider.y -= self.movement_speed # move up
-      if key[pygame.K_d] and player.box_collider.x < canvas.screen_size[0]-player.size: #move right
-            player.box_collider.x += self.movement_speed 
-      if key[pygame.K_a] and player.box_collider.x > 0: # left key
-            player.box_collider.x -= self.movement_speed # move left
\ No newline at end of file
+
+    def handle_keys(self, player, canvas, keys=None):
+        """ Handles Keys. keys can be Engine.keys_held to skip asking SDL for the keyboard state again. """
+        if keys is None:
+            key = pygame.key.get_pressed()
+            right, left, down, up = key[_K_D], key[_K_A], key[_K_S], key[_K_W]
+        elif isinstance(keys, dict):
+            # Engine.keys_held only has entries for keys that have been pressed
+            right, left, down, up = keys.get(_K_D, 0), keys.get(_K_A, 0), keys.get(_K_S, 0), keys.get(_K_W, 0)
+        else:
+            right, left, down, up = keys[_K_D], keys[_K_A], keys[_K_S], keys[_K_W]
+        dx = (right - left) * self.movement_speed
+        dy = (down - up) * self.movement_speed
+        # clamp inside the canvas instead of branching on every direction
+        box_collider = player.box_collider
+        box_collider.x = min(max(box_collider.x + dx, 0), canvas.width - player.size)
+        box_collider.y = min(max(box_collider.y + dy, 0), canvas.height - player.size)
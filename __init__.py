@@ -1,5 +1,6 @@
 from EasyPygame.actors import Player, Character
 from EasyPygame.game_engine import Engine, Canvas
 from EasyPygame.input_controller import KeyboardController
+from EasyPygame.collision import SpatialGrid, batch_overlap
 
     
\ No newline at end of file
@@ -14,9 +14,8 @@ char_list = [player,character]
 # Repeats following code until told otherwise. AKA 'void Loop()'
 @engine.game_loop #All in game logic must come after this decorator.
 def loop():
+    engine.draw_all(char_list)
     for actor in char_list:
-        actor.draw(engine.canvas.surface)
-        if type(actor) == Player:
-            actor.handle_keys(canvas=engine.canvas)
-        if player.check_collision([character]) and character in char_list:
-            char_list.remove(character)
\ No newline at end of file
+        actor.update(engine.canvas, engine.keys_held)
+    if player.check_collision_single(character) and character in char_list:
+        char_list.remove(character)
\ No newline at end of file